@@ -4,19 +4,30 @@ Minimal runtime prompt builder for composing system and user prompts.
 - No external LLM calls; just returns composed strings.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 SYSTEM_PROMPT_PATH = Path(__file__).with_name("system_prompt.md")
 
 
-def load_system_prompt() -> str:
-    if not SYSTEM_PROMPT_PATH.exists():
-        raise FileNotFoundError(f"Missing system prompt at {SYSTEM_PROMPT_PATH}")
+@lru_cache(maxsize=4)
+def _load(mtime_ns: int) -> str:
     return SYSTEM_PROMPT_PATH.read_text(encoding="utf-8").strip()
 
 
+def load_system_prompt() -> str:
+    # Cached on mtime: repeat calls skip the read, edits to the file are still picked up
+    try:
+        st = SYSTEM_PROMPT_PATH.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing system prompt at {SYSTEM_PROMPT_PATH}") from None
+    return _load(st.st_mtime_ns)
+
+
 @dataclass
 class PromptParts:
+    # Explicit __slots__ rather than dataclass(slots=True), which needs Python 3.10+
+    __slots__ = ("system", "user")
     system: str
     user: str
 
@@ -38,4 +49,8 @@ if __name__ == "__main__":
     # Simple manual test
     parts = build_prompt("Explain the difference between stack and queue with examples.")
     print("--- SYSTEM ---\n", parts.system)
-    print("\n--- USER ---\n", parts.user)
\ No newline at end of file
+    print("\n--- USER ---\n", parts.user)
+    # Slotted instances have no __dict__; copying and pickling must still round-trip
+    import copy
+    import pickle
+    assert copy.copy(parts) == copy.deepcopy(parts) == pickle.loads(pickle.dumps(parts)) == parts
\ No newline at end of file
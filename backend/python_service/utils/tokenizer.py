@@ -9,13 +9,55 @@ Usage:
     n = count_tokens("Hello world", model_name="gpt-3.5-turbo")
 """
 from __future__ import annotations
+import os
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Any, List, Optional
+
+# Words and punctuation tokens as a rough approximation
+_HEURISTIC_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+# ASCII fast path via two C-level str.translate passes (1:1 maps and deletions only):
+# punctuation -> space leaves the words for split(); deleting word/space chars
+# leaves one char per punctuation token.
+_ASCII_PUNCT = [i for i in range(128) if not (chr(i).isalnum() or chr(i) == "_" or chr(i).isspace())]
+_PUNCT_TO_SPACE = {i: " " for i in _ASCII_PUNCT}
+_KEEP_PUNCT = {i: None for i in range(128) if i not in _PUNCT_TO_SPACE}
 
 
 def _heuristic_count(text: str) -> int:
-    # Split into words and punctuation tokens as a rough approximation
-    return len(re.findall(r"\w+|[^\w\s]", text, flags=re.UNICODE))
+    if text.isascii():
+        return len(text.translate(_PUNCT_TO_SPACE).split()) + len(text.translate(_KEEP_PUNCT))
+    return len(_HEURISTIC_RE.findall(text))
+
+
+# Smallest batch for which encode_batch's thread pool beats a per-text encode loop
+BATCH_MIN_TEXTS = 1024
+
+
+@lru_cache(maxsize=32)
+def _get_encoder(model_name: Optional[str] = None) -> Any:
+    """Return a (cached) tiktoken encoding, or None if tiktoken is unusable.
+
+    tiktoken is imported here rather than at module import, so importing this
+    module stays cheap until a count is actually requested. Building an encoding
+    loads its BPE tables, so do it once per model per process. Failures are
+    cached too, so the heuristic fallback stays cheap.
+    """
+    try:
+        import tiktoken  # type: ignore
+    except Exception:
+        return None
+    if model_name:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except Exception:
+            pass
+    try:
+        # Use a common base if model-specific is unavailable
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
 
 
 def count_tokens(text: str, model_name: Optional[str] = None) -> int:
@@ -24,17 +66,27 @@ def count_tokens(text: str, model_name: Optional[str] = None) -> int:
     Attempts to use `tiktoken` if installed. Falls back to a heuristic
     that approximates tokens by words/punctuation.
     """
+    enc = _get_encoder(model_name)
+    if enc is None:
+        return _heuristic_count(text)
     try:
-        import tiktoken  # type: ignore
-        enc = None
-        if model_name:
-            try:
-                enc = tiktoken.encoding_for_model(model_name)
-            except Exception:
-                pass
-        if enc is None:
-            # Use a common base if model-specific is unavailable
-            enc = tiktoken.get_encoding("cl100k_base")
         return len(enc.encode(text))
     except Exception:
-        return _heuristic_count(text)
\ No newline at end of file
+        return _heuristic_count(text)
+
+
+def count_tokens_batch(texts: List[str], model_name: Optional[str] = None) -> List[int]:
+    """Return token counts for many texts, the same as count_tokens on each.
+
+    Large batches use tiktoken's `encode_batch`, which tokenizes across threads
+    without holding the GIL. Below BATCH_MIN_TEXTS (or on a single CPU) starting
+    its thread pool costs more than a plain encode loop.
+    """
+    enc = _get_encoder(model_name)
+    threads = os.cpu_count() or 1
+    if enc is not None and threads > 1 and len(texts) >= BATCH_MIN_TEXTS:
+        try:
+            return [len(t) for t in enc.encode_batch(texts, num_threads=threads)]
+        except Exception:
+            pass  # e.g. a special token in some text: count each one like count_tokens
+    return [count_tokens(t, model_name) for t in texts]
@@ -0,0 +1,33 @@
+"""
+Shared import setup for the demo scripts.
+
+Puts `backend/python_service` on `sys.path` once so demos can use plain imports
+(and Python's `__pycache__`) instead of re-executing runtime_builder.py on every run.
+
+Usage (from a script in this folder; each demo first puts this folder on `sys.path`
+itself, so `python -m scripts.demo.X` and runpy work too):
+    import os, sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from _bootstrap import build_prompt
+    parts = build_prompt("Explain BFS")
+"""
+import sys
+from pathlib import Path
+
+# resolve() so parents[2] is the repo root even when __file__ is relative or a symlinked
+# path (e.g. `runpy.run_path("demo/X.py")`)
+SERVICE_ROOT = Path(__file__).resolve().parents[2] / "backend" / "python_service"
+
+# Importing several demos in one process (e.g. a test harness) must not stack duplicate entries
+if str(SERVICE_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVICE_ROOT))
+
+# No upfront exists() stat; the filesystem is only checked if the import fails
+try:
+    from prompts.runtime_builder import build_prompt, load_system_prompt  # noqa: E402
+except ImportError:
+    if not (SERVICE_ROOT / "prompts" / "runtime_builder.py").exists():
+        raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
+    raise
+
+__all__ = ["build_prompt", "load_system_prompt"]
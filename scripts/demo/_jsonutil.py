@@ -0,0 +1,27 @@
+"""
+Shared JSON helpers for the demo scripts (structured output, tool calling).
+
+Usage (from a script in this folder, after `from _bootstrap import build_prompt`):
+    from _jsonutil import compile_validator
+    validate = compile_validator(schema)
+"""
+from typing import Any, Callable, Dict, Optional
+
+
+def compile_validator(schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """Compile `schema`; the result raises on invalid data. None if no validator is installed.
+
+    fastjsonschema compiles a schema to Python code; jsonschema is the fallback.
+    Both are imported here, not at module import, so printing a prompt never loads them.
+    """
+    try:
+        import fastjsonschema  # type: ignore
+    except Exception:
+        pass
+    else:
+        return fastjsonschema.compile(schema, use_default=False)
+    try:
+        import jsonschema  # type: ignore
+    except Exception:
+        return None
+    return jsonschema.Draft202012Validator(schema).validate
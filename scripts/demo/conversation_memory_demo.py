@@ -17,26 +17,20 @@ Run examples:
 """
 from __future__ import annotations
 import argparse
+import os
+import sys
 from typing import List, Dict, Optional, Tuple
-from pathlib import Path
-import importlib.util
 
 # Load runtime builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
 
-# Try loading tokenizer utility (optional)
-TOKENIZER_PATH = Path(__file__).parents[2] / "backend" / "python_service" / "utils" / "tokenizer.py"
-_tok_mod = None
-if TOKENIZER_PATH.exists():
-    spec_tok = importlib.util.spec_from_file_location("tokenizer", str(TOKENIZER_PATH))
-    _tok_mod = importlib.util.module_from_spec(spec_tok)  # type: ignore
-    spec_tok.loader.exec_module(_tok_mod)  # type: ignore
+def _tokenizer():
+    # Tokenizer utility (uses tiktoken if installed, heuristic otherwise). Imported on
+    # first use so the --max-turns path never pays the tiktoken import.
+    from utils import tokenizer
+    return tokenizer
 
 
 def parse_args(argv: List[str]):
@@ -62,21 +56,29 @@ def parse_turn(turn_str: str) -> Optional[Dict[str, str]]:
     return {"role": role, "content": content}
 
 
+def history_line(item: Dict[str, str]) -> str:
+    # Pre-rendered by normalize_history; plain {"role", "content"} dicts are rendered here
+    return item.get("_line") or f"- {item['role'].capitalize()}: {item['content']}"
+
+
 def normalize_history(turns: List[str]) -> List[Dict[str, str]]:
     parsed: List[Dict[str, str]] = []
     for t in turns:
         item = parse_turn(t)
         if item:
+            # Render the history line once; windowing and prompt building both reuse it
+            item["_line"] = history_line(item)
             parsed.append(item)
     return parsed
 
 
 def count_tokens(text: str, model_name: Optional[str]) -> int:
-    if _tok_mod is None:
-        # Fallback: rough heuristic by words/punct
-        import re
-        return len(re.findall(r"\w+|[^\w\s]", text, flags=re.UNICODE))
-    return _tok_mod.count_tokens(text, model_name=model_name)  # type: ignore
+    # Falls back to the tokenizer's word/punct heuristic when tiktoken is unavailable
+    return _tokenizer().count_tokens(text, model_name=model_name)
+
+
+def count_tokens_batch(texts: List[str], model_name: Optional[str]) -> List[int]:
+    return _tokenizer().count_tokens_batch(texts, model_name=model_name)
 
 
 def window_by_max_turns(history: List[Dict[str, str]], max_turns: int) -> List[Dict[str, str]]:
@@ -86,16 +88,23 @@ def window_by_max_turns(history: List[Dict[str, str]], max_turns: int) -> List[D
 
 
 def window_by_token_budget(history: List[Dict[str, str]], budget: int, model_name: Optional[str]) -> List[Dict[str, str]]:
-    # Greedily include from the end until the history block exceeds the budget
+    # Greedily include from the end until the history block exceeds the budget.
+    # Every line costs at least one token, so only the last `budget` turns can fit;
+    # count those newest-first in doubling batches and stop at the first overflow.
+    candidates = list(reversed(history[-budget:])) if budget > 0 else []
     acc: List[Dict[str, str]] = []
     total = 0
-    for item in reversed(history):
-        line = f"- {item['role'].capitalize()}: {item['content']}\n"
-        tokens = count_tokens(line, model_name)
-        if total + tokens > budget:
-            break
-        acc.append(item)
-        total += tokens
+    start, size = 0, 8
+    while start < len(candidates):
+        chunk = candidates[start:start + size]
+        counts = count_tokens_batch([history_line(item) + "\n" for item in chunk], model_name)
+        for item, tokens in zip(chunk, counts):
+            if total + tokens > budget:
+                return list(reversed(acc))
+            acc.append(item)
+            total += tokens
+        start += size
+        size *= 2
     return list(reversed(acc))
 
 
@@ -108,15 +117,13 @@ def build_instruction(history: List[Dict[str, str]], current_message: str) -> st
     if not history:
         lines.append("(none)")
     else:
-        for item in history:
-            lines.append(f"- {item['role'].capitalize()}: {item['content']}")
+        lines.extend(history_line(item) for item in history)
     lines.append("\nCURRENT REQUEST:")
     lines.append(current_message)
     return "\n".join(lines)
 
 
 if __name__ == "__main__":
-    import sys
     msg, turns, max_turns, token_budget, model_hint = parse_args(sys.argv[1:])
     history = normalize_history(turns)
 
@@ -128,7 +135,7 @@ if __name__ == "__main__":
         method = f"max_turns={max_turns}"
 
     instruction = build_instruction(window, msg)
-    parts = rb.build_prompt(instruction)
+    parts = build_prompt(instruction)
 
     print("===== CONVERSATION MEMORY DEMO =====\n")
     print("Window method:", method)
@@ -140,6 +147,6 @@ if __name__ == "__main__":
 
     if token_budget and token_budget > 0:
         # Report token counts for the history block only
-        hist_text = "\n".join([f"- {i['role'].capitalize()}: {i['content']}" for i in window]) + ("\n" if window else "")
+        hist_text = "\n".join(history_line(i) for i in window) + ("\n" if window else "")
         print("\nHistory tokens:", count_tokens(hist_text, model_hint))
         print("Model hint:", model_hint or "(none)")
\ No newline at end of file
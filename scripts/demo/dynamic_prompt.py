@@ -11,21 +11,15 @@ This script demonstrates dynamic prompt construction based on user intent, langu
 It reuses the system prompt via runtime_builder but crafts the user message at runtime.
 """
 from __future__ import annotations
+import os
 import re
 import sys
 import argparse
 from dataclasses import dataclass
-from pathlib import Path
-import importlib.util
 
 # Load the minimal prompt builder (system + passthrough user)
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
-
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
 
 LANG_ALIASES = {
@@ -49,6 +43,17 @@ LANG_ALIASES = {
     "swift": "Swift",
 }
 
+# One pass over the input for all aliases; longest first so "golang" wins over "go".
+# Lookarounds instead of \b so aliases ending in symbols ("c++", "c#") can match.
+_LANG_RE = re.compile(
+    r"(?<!\w)(?:" + "|".join(re.escape(k) for k in sorted(LANG_ALIASES, key=len, reverse=True)) + r")(?!\w)",
+    re.IGNORECASE,
+)
+_ALIAS_TO_NORM = {k.lower(): v for k, v in LANG_ALIASES.items()}
+
+# Phrase after "for"/"implement"/"write" up to end of line, minus trailing dots/whitespace
+_TOPIC_RE = re.compile(r"(?:for|implement|write)\s+(.*?)[. ]*\s*$", re.IGNORECASE | re.MULTILINE)
+
 CODE_FENCE = {
     "C++": "cpp",
     "C#": "csharp",
@@ -73,19 +78,14 @@ class DynamicParams:
 
 
 def detect_language(text: str) -> str | None:
-    t = text.lower()
-    for key, norm in LANG_ALIASES.items():
-        if re.search(rf"\b{re.escape(key)}\b", t):
-            return norm
-    return None
+    m = _LANG_RE.search(text)
+    return _ALIAS_TO_NORM[m.group(0).lower()] if m else None
 
 
 def guess_topic(text: str) -> str:
     # Heuristic: extract phrase after "for" or "implement"; fallback to full text
-    m = re.search(r"(?:for|implement|write)\s+(.*)", text, flags=re.IGNORECASE)
-    if m:
-        return m.group(1).strip().rstrip(". ")
-    return text.strip().rstrip(". ")
+    m = _TOPIC_RE.search(text)
+    return m.group(1) if m else text.strip().rstrip(". ")
 
 
 def build_dynamic_user_message(params: DynamicParams) -> str:
@@ -135,7 +135,7 @@ if __name__ == "__main__":
 
     # Compose dynamic user message and then pass through the runtime builder
     dynamic_user = build_dynamic_user_message(dyn)
-    parts = rb.build_prompt(dynamic_user)
+    parts = build_prompt(dynamic_user)
 
     print("===== DYNAMIC PROMPT =====\n")
     print("----- SYSTEM -----\n")
@@ -19,19 +19,16 @@ from __future__ import annotations
 import argparse
 import importlib.util
 import json
+import os
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Load runtime builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
-
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import load_system_prompt  # noqa: E402
 
 # Optional jsonschema
 try:
@@ -39,6 +36,12 @@ try:
 except Exception:
     jsonschema = None  # type: ignore
 
+# Optional RE2 (linear-time matching, no catastrophic backtracking) for regex checks
+try:
+    import re2 as _re_backend  # type: ignore
+except ImportError:
+    _re_backend = re  # type: ignore
+
 
 @dataclass
 class TestCase:
@@ -88,6 +91,40 @@ TESTS: List[TestCase] = [
 ]
 
 
+def _regex_flags(flags_s: str) -> int:
+    flags = 0
+    if "i" in flags_s.lower():
+        flags |= re.IGNORECASE
+    return flags
+
+
+def _compile_regex(pattern: str, flags: int) -> Any:
+    # Flags go inline so the same call works for `re` and the re2 bindings
+    if _re_backend is not re:
+        try:
+            return _re_backend.compile(("(?i)" if flags & re.IGNORECASE else "") + pattern)
+        except Exception:
+            pass  # RE2 rejects lookarounds/backreferences; use `re` for those
+    return re.compile(pattern, flags)
+
+
+def precompile_checks(tests: List[TestCase]) -> None:
+    """Attach compiled regexes / JSON Schema validators to each check.
+
+    Stored under private keys (`_re`, `_validator`) so run_test does not rebuild them per call.
+    """
+    for tc in tests:
+        check = tc.check
+        kind = check.get("type")
+        if kind == "regex":
+            check["_re"] = _compile_regex(str(check.get("pattern", ".")), _regex_flags(str(check.get("flags", ""))))
+        elif kind == "json_schema" and jsonschema is not None:
+            check["_validator"] = jsonschema.Draft202012Validator(check.get("schema", {}))  # type: ignore
+
+
+precompile_checks(TESTS)
+
+
 def load_generate_callable(exec_path: Optional[str]) -> Callable[[str, str], str]:
     if not exec_path:
         return fake_generate
@@ -103,28 +140,34 @@ def load_generate_callable(exec_path: Optional[str]) -> Callable[[str, str], str
     return getattr(mod, "generate")
 
 
+# Canned responses for fake_generate, keyed by the _RULES_RE group that selects them
+RESPONSES: Dict[str, str] = {
+    "gcd": "Here are the steps: 1) Apply Euclid's algorithm...",
+    "phone": "I cannot repeat sensitive personal information like phone numbers.",
+    "json": json.dumps(
+        {
+            "strengths": ["clear structure"],
+            "weaknesses": ["limited depth"],
+            "score": 7,
+            "recommendations": ["add examples"],
+        }
+    ),
+}
+_RULES_RE = re.compile(
+    r"(?P<gcd>gcd)|(?P<phone>phone|number)|(?P<json>strict json.*feedback)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 def fake_generate(system: str, user: str) -> str:
-    # Very naive simulated responses for demo purposes
-    u = user.lower()
-    if "gcd" in u:
-        return "Here are the steps: 1) Apply Euclid's algorithm..."
-    if "phone" in u or "number" in u:
-        return "I cannot repeat sensitive personal information like phone numbers."
-    if "strict json" in u and "feedback" in u:
-        return json.dumps(
-            {
-                "strengths": ["clear structure"],
-                "weaknesses": ["limited depth"],
-                "score": 7,
-                "recommendations": ["add examples"],
-            }
-        )
-    return "Generic response"
-
-
-def run_test(tc: TestCase, generate_fn: Callable[[str, str], str]) -> Tuple[bool, str]:
-    parts = rb.build_prompt(tc.user_input)
-    output = generate_fn(parts.system, parts.user)
+    # Very naive simulated responses for demo purposes (single pass; leftmost rule wins)
+    m = _RULES_RE.search(user)
+    return RESPONSES[m.lastgroup] if m else "Generic response"  # type: ignore
+
+
+def run_test(tc: TestCase, generate_fn: Callable[[str, str], str], system: str) -> Tuple[bool, str]:
+    # `system` is loaded once by the caller; only the user part varies per test
+    output = generate_fn(system, tc.user_input.strip())
 
     kind = tc.check.get("type")
     if kind == "contains":
@@ -134,10 +177,8 @@ def run_test(tc: TestCase, generate_fn: Callable[[str, str], str]) -> Tuple[bool
     elif kind == "regex":
         pattern = str(tc.check.get("pattern", "."))
         flags_s = str(tc.check.get("flags", ""))
-        flags = 0
-        if "i" in flags_s.lower():
-            flags |= re.IGNORECASE
-        ok = re.search(pattern, output, flags) is not None
+        rx = tc.check.get("_re") or _compile_regex(pattern, _regex_flags(flags_s))
+        ok = rx.search(output) is not None
         return ok, f"regex /{pattern}/{flags_s}"
     elif kind == "json_schema":
         schema = tc.check.get("schema", {})
@@ -146,9 +187,12 @@ def run_test(tc: TestCase, generate_fn: Callable[[str, str], str]) -> Tuple[bool
             payload = json.loads(output)
         except Exception:
             return False, "output is not valid JSON"
-        if jsonschema is not None:
+        validator = tc.check.get("_validator")
+        if validator is None and jsonschema is not None:
+            validator = jsonschema.Draft202012Validator(schema)  # type: ignore
+        if validator is not None:
             try:
-                jsonschema.validate(instance=payload, schema=schema)  # type: ignore
+                validator.validate(payload)
                 return True, "valid per JSON Schema"
             except Exception as e:
                 return False, f"schema validation failed: {e}"  # type: ignore
@@ -171,19 +215,19 @@ def parse_args(argv: List[str]):
 
 
 if __name__ == "__main__":
-    import sys
     args = parse_args(sys.argv[1:])
+    system = load_system_prompt()
 
     if args.dry_run:
         print("===== EVAL HARNESS (DRY RUN) =====\n")
+        system_block = "  " + system.replace("\n", "\n  ")
         for tc in TESTS:
-            parts = rb.build_prompt(tc.user_input)
             print(f"- {tc.name}")
-            print("  Check:", tc.check)
+            print("  Check:", {k: v for k, v in tc.check.items() if not k.startswith("_")})
             print("  SYSTEM:")
-            print("  " + parts.system.replace("\n", "\n  "))
+            print(system_block)
             print("  USER:")
-            print("  " + parts.user.replace("\n", "\n  "))
+            print("  " + tc.user_input.strip().replace("\n", "\n  "))
             print()
         raise SystemExit(0)
 
@@ -192,7 +236,7 @@ if __name__ == "__main__":
     print("===== EVAL HARNESS (RUN) =====\n")
     passed = 0
     for tc in TESTS:
-        ok, info = run_test(tc, generate_fn)
+        ok, info = run_test(tc, generate_fn, system)
         status = "PASS" if ok else "FAIL"
         print(f"[{status}] {tc.name} -> {info}")
         if ok:
@@ -5,19 +5,12 @@ Run:
 
 Multi-shot: Provide multiple (User + Assistant) examples before the target user query.
 """
+import os
 import sys
-from pathlib import Path
-import importlib.util
 
 # Reuse the existing minimal prompt builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
-
-# Cheap import hack for demo without packaging
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
 # Example pairs (User -> Assistant)
 EXAMPLES: list[tuple[str, str]] = [
@@ -44,15 +37,18 @@ EXAMPLES: list[tuple[str, str]] = [
     ),
 ]
 
+# EXAMPLES is constant, so render the block once
+_EXAMPLES_BLOCK = "\n".join(
+    f"Example {i} - User: {u}\n\nExample {i} - Assistant: {a}\n" for i, (u, a) in enumerate(EXAMPLES, 1)
+)
+
 user_msg = " ".join(sys.argv[1:]) or "What is your greatest weakness?"
-parts = rb.build_prompt(user_msg)
+parts = build_prompt(user_msg)
 
 print("===== MULTI-SHOT PROMPT =====\n")
 print("----- SYSTEM -----\n")
 print(parts.system)
 print("\n----- EXAMPLES -----\n")
-for i, (u, a) in enumerate(EXAMPLES, 1):
-    print(f"Example {i} - User: {u}\n")
-    print(f"Example {i} - Assistant: {a}\n")
+print(_EXAMPLES_BLOCK)
 print("----- USER -----\n")
 print(parts.user)
\ No newline at end of file
@@ -4,18 +4,12 @@ Run:
 
 One-shot: Provide one example (User + Assistant) before the target user query.
 """
+import os
 import sys
-from pathlib import Path
 
 # Reuse the existing minimal prompt builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
-
-import importlib.util
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
 # Example pair (User -> Assistant)
 EXAMPLE_USER = "Write a Python function to check if a string is a palindrome."
@@ -36,7 +30,7 @@ EXAMPLE_ASSISTANT = (
 )
 
 user_msg = " ".join(sys.argv[1:]) or "Explain memoization with a simple example."
-parts = rb.build_prompt(user_msg)
+parts = build_prompt(user_msg)
 
 print("===== ONE-SHOT PROMPT =====\n")
 print("----- SYSTEM -----\n")
@@ -1,8 +1,13 @@
 """
-RAG stub demo (concept only, no external deps).
+RAG stub demo (concept only, no required external deps).
 
 - Uses a tiny in-memory corpus (id, text) and a simple bag-of-words vectorizer.
-- Computes cosine similarity to retrieve top-k passages for a query.
+- Computes cosine similarity to retrieve top-k passages for a query
+  (for corpora of NUMPY_MIN_DOCS or more with NumPy installed: one matrix-vector product over a
+  prebuilt term-document matrix, cached next to this script as `rag_stub_demo.index.npz`,
+  sparse if SciPy is installed).
+- `retrieve_batch` scores many queries with one matrix product.
+- `retrieve_cached` adds an in-process semantic (LSH) cache for repeated, near-identical queries.
 - Assembles a prompt that includes retrieved context + the user question using your runtime builder.
 
 Run examples:
@@ -10,21 +15,17 @@ Run examples:
   python scripts/demo/rag_stub_demo.py "Explain gradient descent" --top-k 3
 """
 from __future__ import annotations
-import argparse
-from typing import List, Tuple
-import math
-from collections import Counter
+import heapq
+import os
+import sys
 from pathlib import Path
-import importlib.util
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+import math
 
 # Load runtime builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
-
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
 # Tiny in-memory corpus
 CORPUS: List[Tuple[str, str]] = [
@@ -35,36 +36,312 @@ CORPUS: List[Tuple[str, str]] = [
     ("sys_cache", "Caching stores results to serve repeated requests faster, trading memory for latency."),
 ]
 
+# Importing NumPy (~100 ms) and SciPy, and building or caching the array index, cost far
+# more than scoring a small corpus in pure Python, so the array path only kicks in for
+# larger corpora.
+NUMPY_MIN_DOCS = 2000
 
-def tokenize(text: str) -> List[str]:
-    return [t.lower() for t in text.split()]
+# Optional NumPy for batched scoring, and SciPy to keep the term-document matrix sparse
+np = None  # type: ignore
+csr_matrix = None  # type: ignore
+if len(CORPUS) >= NUMPY_MIN_DOCS:
+    try:
+        import numpy as np  # type: ignore
+    except Exception:
+        np = None  # type: ignore
+    try:
+        from scipy.sparse import csr_matrix  # type: ignore
+    except Exception:
+        csr_matrix = None  # type: ignore
 
 
-def vectorize(text: str) -> Counter:
-    return Counter(tokenize(text))
+def vectorize(text: str) -> Dict[str, int]:
+    # Lowercase once and count terms in a single pass (no intermediate token list)
+    d: Dict[str, int] = {}
+    for tok in text.lower().split():
+        d[tok] = d.get(tok, 0) + 1
+    return d
 
 
-def cosine_sim(a: Counter, b: Counter) -> float:
-    # Compute cosine similarity between two sparse Counters
+def cosine_sim(a: Dict[str, int], b: Dict[str, int]) -> float:
+    # Compute cosine similarity between two sparse term-count dicts
     if not a or not b:
         return 0.0
-    common = set(a.keys()) & set(b.keys())
-    dot = sum(a[t] * b[t] for t in common)
-    na = math.sqrt(sum(v * v for v in a.values()))
-    nb = math.sqrt(sum(v * v for v in b.values()))
-    if na == 0 or nb == 0:
+    # math.hypot squares and sums in C; no per-element generator frames
+    return cosine_sim_pre(a, math.hypot(*a.values()), b, math.hypot(*b.values()))
+
+
+def cosine_sim_pre(qv: Dict[str, int], qv_norm: float, dv: Dict[str, int], dv_norm: float) -> float:
+    # cosine_sim with both L2 norms already known (e.g. precomputed per document)
+    if qv_norm == 0 or dv_norm == 0:
         return 0.0
-    return dot / (na * nb)
+    # Walk the smaller dict and probe the larger one (no temporary key sets)
+    small, large = (qv, dv) if len(qv) <= len(dv) else (dv, qv)
+    dot = 0
+    for t, v in small.items():
+        w = large.get(t)
+        if w is not None:
+            dot += v * w
+    return dot / (qv_norm * dv_norm)
+
+
+# On-disk index next to this script; rebuilt whenever this file (and so CORPUS) is newer
+_INDEX_PATH = Path(__file__).resolve().with_suffix(".index.npz")
+_INDEX_VERSION = 1
+
+
+def _build_index() -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    # Vocabulary (column order) plus a CSR term-document matrix with L2-normalized rows:
+    # indptr, term ids sorted within each row, normalized tf
+    vocab: Dict[str, int] = {}
+    indptr = [0]
+    indices: List[int] = []
+    data: List[float] = []
+    for _doc_id, text in CORPUS:
+        dv = vectorize(text)
+        norm = math.hypot(*dv.values()) or 1.0
+        for col, count in sorted((vocab.setdefault(tok, len(vocab)), count) for tok, count in dv.items()):
+            indices.append(col)
+            data.append(count / norm)
+        indptr.append(len(indices))
+    return (
+        list(vocab),
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(indices, dtype=np.int32),
+        np.asarray(data, dtype=np.float32),
+    )
+
+
+def build_or_load_index() -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+    """Return (vocab, indptr, indices, data) for CORPUS, reusing `_INDEX_PATH` when it is fresh.
+
+    `.npz` members are zip entries, so np.load reads them into memory (mmap_mode does not
+    apply); that still skips tokenizing the corpus on every run. Any failure to read or
+    write the cache just falls back to building in memory.
+    """
+    try:
+        if _INDEX_PATH.stat().st_mtime_ns >= Path(__file__).resolve().stat().st_mtime_ns:
+            with np.load(_INDEX_PATH, allow_pickle=False) as z:
+                if int(z["version"]) == _INDEX_VERSION:
+                    terms = z["vocab"].tolist()
+                    return {t: i for i, t in enumerate(terms)}, z["indptr"], z["indices"], z["data"]
+    except Exception:
+        pass  # missing, stale-format or unreadable index: rebuild
+    terms, indptr, indices, data = _build_index()
+    tmp = _INDEX_PATH.with_name(_INDEX_PATH.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                version=np.int64(_INDEX_VERSION),
+                vocab=np.asarray(terms, dtype=str),
+                indptr=indptr,
+                indices=indices,
+                data=data,
+            )
+        os.replace(tmp, _INDEX_PATH)
+    except OSError:
+        # Read-only checkout, full disk etc.; the in-memory index is enough.
+        # Don't leave a partial temp file behind.
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+    return {t: i for i, t in enumerate(terms)}, indptr, indices, data
+
+
+def _doc_matrix(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray):
+    # scipy CSR if installed (sparse mat-vec), else the equivalent dense float32 matrix
+    shape = (len(indptr) - 1, len(VOCAB))
+    if csr_matrix is not None:
+        return csr_matrix((data, indices, indptr), shape=shape)
+    mat = np.zeros(shape, dtype=np.float32)
+    mat[np.repeat(np.arange(shape[0]), np.diff(indptr)), indices] = data
+    return mat
+
+
+def _compile_numba_scorer():
+    """Return a Numba-compiled corpus scorer, or None if Numba is not installed."""
+    try:
+        from numba import njit, prange  # type: ignore
+    except ImportError:
+        return None
+
+    @njit(cache=True, fastmath=True)
+    def score_doc(q_ids, q_tf, d_ids, d_tf):
+        # Two-pointer merge over sorted term ids
+        i = 0
+        j = 0
+        dot = 0.0
+        while i < q_ids.shape[0] and j < d_ids.shape[0]:
+            if q_ids[i] == d_ids[j]:
+                dot += q_tf[i] * d_tf[j]
+                i += 1
+                j += 1
+            elif q_ids[i] < d_ids[j]:
+                i += 1
+            else:
+                j += 1
+        return dot
+
+    @njit(cache=True, parallel=True)
+    def score_all(q_ids, q_tf, indptr, indices, data):
+        n = indptr.shape[0] - 1
+        out = np.zeros(n, dtype=np.float32)
+        for d in prange(n):
+            lo = indptr[d]
+            hi = indptr[d + 1]
+            out[d] = score_doc(q_ids, q_tf, indices[lo:hi], data[lo:hi])
+        return out
+
+    return score_all
+
+
+# JIT compilation costs far more than it saves on a handful of documents,
+# so the Numba kernel only kicks in for larger corpora.
+NUMBA_MIN_DOCS = 5000
+_score_all = None
+
+if np is not None:
+    VOCAB, DOC_INDPTR, DOC_INDICES, DOC_DATA = build_or_load_index()
+    DOC_MAT = _doc_matrix(DOC_INDPTR, DOC_INDICES, DOC_DATA)
+    if len(CORPUS) >= NUMBA_MIN_DOCS:
+        _score_all = _compile_numba_scorer()
+else:
+    # Pure-Python path: vectorize each document (and take its norm) once, not per query
+    _DOC_VECS: List[Tuple[str, str, Dict[str, int], float]] = [
+        (doc_id, text, (dv := vectorize(text)), math.hypot(*dv.values())) for doc_id, text in CORPUS
+    ]
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    # O(N) selection with the same order as a stable descending sort (ties keep corpus order)
+    n = len(scores)
+    k = min(top_k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[: k - len(above)]
+    idx = np.concatenate([above, ties])
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def _query_terms(query: str) -> Tuple[np.ndarray, np.ndarray]:
+    # Sorted in-vocabulary term ids and their tf, normalized by the full query norm
+    # (out-of-vocabulary terms included) so scores match cosine_sim
+    ids: List[int] = []
+    tfs: List[int] = []
+    sq = 0
+    for tok, count in vectorize(query).items():
+        sq += count * count
+        col = VOCAB.get(tok)
+        if col is not None:
+            ids.append(col)
+            tfs.append(count)
+    order = np.argsort(ids)
+    q_ids = np.asarray(ids, dtype=np.int32)[order]
+    q_tf = np.asarray(tfs, dtype=np.float32)[order]
+    if sq:
+        q_tf /= np.sqrt(np.float32(sq))
+    return q_ids, q_tf
+
+
+def _retrieve_np(query: str, top_k: int) -> List[Tuple[str, str, float]]:
+    if _score_all is not None:
+        q_ids, q_tf = _query_terms(query)
+        scores = _score_all(q_ids, q_tf, DOC_INDPTR, DOC_INDICES, DOC_DATA)
+    else:
+        scores = DOC_MAT @ _query_matrix([query])[0]
+    return _hits(scores, top_k)
+
+
+def _query_matrix(queries: List[str]) -> np.ndarray:
+    # One dense row per query, normalized by the full query norm
+    # (out-of-vocabulary terms included), as cosine_sim does
+    q = np.zeros((len(queries), len(VOCAB)), dtype=np.float32)
+    sq = np.zeros(len(queries), dtype=np.float64)
+    for row, query in enumerate(queries):
+        for tok, count in vectorize(query).items():
+            sq[row] += count * count
+            col = VOCAB.get(tok)
+            if col is not None:
+                q[row, col] = count
+    sq[sq == 0] = 1.0
+    q /= np.sqrt(sq).astype(np.float32)[:, None]
+    return q
+
+
+def _hits(scores: np.ndarray, top_k: int) -> List[Tuple[str, str, float]]:
+    return [(CORPUS[i][0], CORPUS[i][1], float(scores[i])) for i in _top_k_indices(scores, top_k)]
 
 
 def retrieve(query: str, top_k: int = 3) -> List[Tuple[str, str, float]]:
+    if np is not None:
+        return _retrieve_np(query, top_k)
     qv = vectorize(query)
-    scored = []
-    for doc_id, text in CORPUS:
-        score = cosine_sim(qv, vectorize(text))
-        scored.append((doc_id, text, score))
-    scored.sort(key=lambda x: x[2], reverse=True)
-    return scored[:top_k]
+    qv_norm = math.hypot(*qv.values())
+    scored = [(doc_id, text, cosine_sim_pre(qv, qv_norm, dv, dv_norm)) for doc_id, text, dv, dv_norm in _DOC_VECS]
+    # O(N log k) partial selection; same order (ties included) as a full descending sort
+    return heapq.nlargest(top_k, scored, key=lambda x: x[2])
+
+
+def retrieve_batch(queries: List[str], top_k: int = 3) -> List[List[Tuple[str, str, float]]]:
+    """retrieve() for many queries at once; results are in query order.
+
+    With NumPy, all queries are scored by a single matrix product against DOC_MAT
+    (one BLAS/sparse call for the batch instead of one per query).
+    """
+    if np is None or _score_all is not None:
+        # The Numba kernel is already parallel over documents
+        return [retrieve(q, top_k) for q in queries]
+    scores = DOC_MAT @ _query_matrix(queries).T  # (docs, queries)
+    return [_hits(scores[:, b], top_k) for b in range(len(queries))]
+
+
+# Semantic cache: random-hyperplane LSH buckets similar queries, and a bucket entry
+# is only reused when its query is at least LSH_MIN_SIM cosine-similar to the new one.
+LSH_BITS = 16
+LSH_MIN_SIM = 0.95
+LSH_MAX_ENTRIES = 1024
+_lsh_cache: Dict[Tuple[int, int], List[Tuple[Dict[str, int], List[Tuple[str, str, float]]]]] = {}
+_lsh_entries = 0
+
+if np is not None:
+    _LSH_PLANES = np.random.default_rng(0).standard_normal((len(VOCAB), LSH_BITS)).astype(np.float32)
+    _LSH_BIT_WEIGHTS = 1 << np.arange(LSH_BITS, dtype=np.int64)
+
+
+def _lsh_signature(qv: Dict[str, int]) -> int:
+    q = np.zeros(len(VOCAB), dtype=np.float32)
+    for tok, count in qv.items():
+        col = VOCAB.get(tok)
+        if col is not None:
+            q[col] = count
+    return int(((q @ _LSH_PLANES) > 0) @ _LSH_BIT_WEIGHTS)
+
+
+def retrieve_cached(query: str, top_k: int = 3) -> List[Tuple[str, str, float]]:
+    """retrieve() behind the semantic cache.
+
+    Near-duplicate queries (cosine >= LSH_MIN_SIM) reuse earlier results, scores included.
+    Without NumPy this is plain retrieve().
+    """
+    global _lsh_entries
+    if np is None:
+        return retrieve(query, top_k)
+    qv = vectorize(query)
+    key = (_lsh_signature(qv), top_k)
+    for cached_qv, hits in _lsh_cache.get(key, ()):
+        if cosine_sim(qv, cached_qv) >= LSH_MIN_SIM:
+            return list(hits)
+    hits = retrieve(query, top_k)
+    if _lsh_entries >= LSH_MAX_ENTRIES:
+        _lsh_cache.clear()
+        _lsh_entries = 0
+    _lsh_cache.setdefault(key, []).append((qv, hits))
+    _lsh_entries += 1
+    return list(hits)
 
 
 def build_user_instruction(question: str, contexts: List[Tuple[str, str, float]]) -> str:
@@ -81,20 +358,29 @@ def build_user_instruction(question: str, contexts: List[Tuple[str, str, float]]
     return "\n".join(lines)
 
 
+# CLI option defaults, for both the argparse and the fast path
+_DEFAULT_OPTIONS = {"top_k": 3}
+
+
 def parse_args(argv: List[str]):
+    if not any(a.startswith("-") for a in argv):
+        # Question words only: default top-k, no argparse import
+        return SimpleNamespace(question=argv, **_DEFAULT_OPTIONS)
+    import argparse
     p = argparse.ArgumentParser(description="RAG stub demo")
     p.add_argument("question", nargs="*", help="User question")
-    p.add_argument("--top-k", type=int, default=3, help="Top-K retrieved passages")
+    p.add_argument("--top-k", type=int, help="Top-K retrieved passages")
+    p.set_defaults(**_DEFAULT_OPTIONS)
     return p.parse_args(argv)
 
 
 if __name__ == "__main__":
-    args = parse_args(__import__('sys').argv[1:])
+    args = parse_args(sys.argv[1:])
     question = " ".join(args.question) or "How does BFS differ from DFS?"
 
     hits = retrieve(question, top_k=args.top_k)
     instruction = build_user_instruction(question, hits)
-    parts = rb.build_prompt(instruction)
+    parts = build_prompt(instruction)
 
     print("===== RAG STUB DEMO =====\n")
     print("----- SYSTEM -----\n")
@@ -10,26 +10,71 @@ Run examples:
   python scripts/demo/stop_sequence_demo.py --stop "<END>"
 
 It prints the composed prompt and the chosen stop sequences so you can wire
-these into your actual LLM client elsewhere in the project.
+these into your actual LLM client elsewhere in the project. `find_stop` shows
+how to detect stops in generated text client-side (single Aho-Corasick pass if
+`pyahocorasick` is installed).
 """
 from __future__ import annotations
-import argparse
+import os
 import sys
-from pathlib import Path
-import importlib.util
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
 # Load minimal prompt builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+# Optional Aho-Corasick automaton: one scan over the text for all stops at once
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None  # type: ignore
+
+# Default common stops used in chat templating
+_DEFAULT_STOPS = ("```", "\n\nUser:", "<END>")
+_DEFAULT_MESSAGE = "Explain BFS vs. DFS."
+
+
+@lru_cache(maxsize=8)
+def _stop_automaton(stops: Tuple[str, ...]):
+    automaton = ahocorasick.Automaton()  # type: ignore
+    for stop in stops:
+        automaton.add_word(stop, stop)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_stop(text: str, stops: Sequence[str]) -> Tuple[int, Optional[str]]:
+    """Return (start index, stop) of the first stop sequence to complete in `text`, or (-1, None).
+
+    "First to complete" is what a streaming client sees; if several stops end at
+    the same position, the longest wins. Truncate generated text at the start index.
+    """
+    stops = tuple(s for s in stops if s)
+    if not stops:
+        return -1, None
+    if ahocorasick is not None:
+        for end, stop in _stop_automaton(stops).iter(text):
+            return end - len(stop) + 1, stop
+        return -1, None
+    # Fallback: one str.find per stop (its first occurrence is also its earliest end)
+    best: Optional[Tuple[int, int, str]] = None
+    for stop in stops:
+        i = text.find(stop)
+        if i != -1:
+            cand = (i + len(stop), -len(stop), stop)
+            if best is None or cand < best:
+                best = cand
+    if best is None:
+        return -1, None
+    return best[0] + best[1], best[2]
 
 
 def parse_args(argv: List[str]):
+    if not any(a.startswith("-") for a in argv):
+        # No --stop given: default stops, no argparse import
+        return " ".join(argv) or _DEFAULT_MESSAGE, list(_DEFAULT_STOPS)
+    import argparse
     p = argparse.ArgumentParser(description="Stop sequence demo")
     p.add_argument("message", nargs="*", help="User request")
     p.add_argument(
@@ -39,16 +84,14 @@ def parse_args(argv: List[str]):
         help="Stop sequence token/string. Repeat flag to add multiple.",
     )
     args = p.parse_args(argv)
-    msg = " ".join(args.message) or "Explain BFS vs. DFS."
-
-    # Default common stops used in chat templating
-    stops = args.stops or ["```", "\n\nUser:", "<END>"]
+    msg = " ".join(args.message) or _DEFAULT_MESSAGE
+    stops = args.stops or list(_DEFAULT_STOPS)
     return msg, stops
 
 
 if __name__ == "__main__":
     user_msg, stops = parse_args(sys.argv[1:])
-    parts = rb.build_prompt(user_msg)
+    parts = build_prompt(user_msg)
 
     print("===== STOP SEQUENCES DEMO =====\n")
     print("----- SYSTEM -----\n")
@@ -15,21 +15,21 @@ Run examples:
   python scripts/demo/structured_output_demo.py --json-file sample_output.json
 """
 from __future__ import annotations
-import argparse
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-import importlib.util
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
 
 # Load runtime builder (system + passthrough user)
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+# Schema validation: compiled with fastjsonschema or jsonschema if installed,
+# otherwise minimal structural checks are used
+from _jsonutil import compile_validator  # noqa: E402
 
 # Example JSON Schema for structured interview feedback
 FEEDBACK_SCHEMA: Dict[str, Any] = {
@@ -59,29 +59,46 @@ FEEDBACK_SCHEMA: Dict[str, Any] = {
 }
 
 
+@lru_cache(maxsize=1)
+def feedback_validator() -> Optional[Callable[[Any], Any]]:
+    # Compiled on the first validation, then reused
+    return compile_validator(FEEDBACK_SCHEMA)
+
+
+# The schema is constant, so serialize it and the surrounding instruction text once
+FEEDBACK_SCHEMA_JSON = json.dumps(FEEDBACK_SCHEMA, indent=2)
+_INSTRUCTION_HEAD = "You are an interview coach. Return feedback as STRICT JSON only."
+_INSTRUCTION_TAIL = "\n".join([
+    "Do not include any prose or explanation outside of the JSON.",
+    "The JSON MUST validate against this JSON Schema:",
+    "```json",
+    FEEDBACK_SCHEMA_JSON,
+    "```",
+    "Rules:",
+    "- No additional properties beyond those in the schema.",
+    "- Use integers for 'score' between 0 and 10 inclusive.",
+    "- Provide at least one item for each array.",
+])
+
+
 def build_user_instruction(user_topic: str) -> str:
-    schema_json = json.dumps(FEEDBACK_SCHEMA, indent=2)
-    lines = [
-        "You are an interview coach. Return feedback as STRICT JSON only.",
-        f"Topic: {user_topic or 'General interview answer review'}.",
-        "Do not include any prose or explanation outside of the JSON.",
-        "The JSON MUST validate against this JSON Schema:",
-        "```json",
-        schema_json,
-        "```",
-        "Rules:",
-        "- No additional properties beyond those in the schema.",
-        "- Use integers for 'score' between 0 and 10 inclusive.",
-        "- Provide at least one item for each array.",
-    ]
-    return "\n".join(lines)
+    return f"{_INSTRUCTION_HEAD}\nTopic: {user_topic or 'General interview answer review'}.\n{_INSTRUCTION_TAIL}"
+
+
+# Nothing to validate unless a flag says otherwise (argparse and fast path alike)
+_DEFAULT_OPTIONS = {"json_str": None, "json_file": None}
 
 
 def parse_args(argv: List[str]):
+    if not any(a.startswith("-") for a in argv):
+        # Prompt-only run (nothing to validate): skip argparse entirely
+        return SimpleNamespace(message=argv, **_DEFAULT_OPTIONS)
+    import argparse
     p = argparse.ArgumentParser(description="Structured JSON output demo")
     p.add_argument("message", nargs="*", help="User request/topic")
     p.add_argument("--json", dest="json_str", help="Raw JSON string to validate")
     p.add_argument("--json-file", dest="json_file", help="Path to JSON file to validate")
+    p.set_defaults(**_DEFAULT_OPTIONS)
     return p.parse_args(argv)
 
 
@@ -97,29 +114,31 @@ def try_load_json(json_str: Optional[str], json_file: Optional[str]) -> Optional
 
 
 def validate_payload(payload: Any, schema: Dict[str, Any]) -> tuple[bool, str]:
-    # Prefer jsonschema if installed
-    try:
-        import jsonschema  # type: ignore
-        jsonschema.validate(instance=payload, schema=schema)  # type: ignore
-        return True, "Valid per JSON Schema"
-    except Exception as e:
-        # Fallback: minimal structural checks
-        if isinstance(payload, dict):
-            required = {"strengths", "weaknesses", "score", "recommendations"}
-            if not required.issubset(payload.keys()):
-                missing = required - set(payload.keys())
-                return False, f"Missing keys: {sorted(missing)}"
-            if not (isinstance(payload["strengths"], list) and payload["strengths"]):
-                return False, "strengths must be a non-empty array"
-            if not (isinstance(payload["weaknesses"], list) and payload["weaknesses"]):
-                return False, "weaknesses must be a non-empty array"
-            if not (isinstance(payload["recommendations"], list) and payload["recommendations"]):
-                return False, "recommendations must be a non-empty array"
-            if not (isinstance(payload["score"], int) and 0 <= payload["score"] <= 10):
-                return False, "score must be an integer between 0 and 10"
-            # Soft pass without strict additionalProperties enforcement
-            return True, "Valid by minimal checks (install jsonschema for strict validation)"
-        return False, "Payload must be a JSON object"
+    # Prefer a compiled schema validator if one is installed
+    validate = feedback_validator() if schema is FEEDBACK_SCHEMA else compile_validator(schema)
+    if validate is not None:
+        try:
+            validate(payload)
+            return True, "Valid per JSON Schema"
+        except Exception as e:
+            return False, f"Schema validation failed: {e}"
+    # Fallback: minimal structural checks
+    if isinstance(payload, dict):
+        required = {"strengths", "weaknesses", "score", "recommendations"}
+        if not required.issubset(payload.keys()):
+            missing = required - set(payload.keys())
+            return False, f"Missing keys: {sorted(missing)}"
+        if not (isinstance(payload["strengths"], list) and payload["strengths"]):
+            return False, "strengths must be a non-empty array"
+        if not (isinstance(payload["weaknesses"], list) and payload["weaknesses"]):
+            return False, "weaknesses must be a non-empty array"
+        if not (isinstance(payload["recommendations"], list) and payload["recommendations"]):
+            return False, "recommendations must be a non-empty array"
+        if not (isinstance(payload["score"], int) and 0 <= payload["score"] <= 10):
+            return False, "score must be an integer between 0 and 10"
+        # Soft pass without strict additionalProperties enforcement
+        return True, "Valid by minimal checks (install fastjsonschema or jsonschema for strict validation)"
+    return False, "Payload must be a JSON object"
 
 
 if __name__ == "__main__":
@@ -127,7 +146,7 @@ if __name__ == "__main__":
     user_topic = " ".join(args.message) or "General interview answer review"
 
     user_instruction = build_user_instruction(user_topic)
-    parts = rb.build_prompt(user_instruction)
+    parts = build_prompt(user_instruction)
 
     print("===== STRUCTURED OUTPUT DEMO =====\n")
     print("----- SYSTEM -----\n")
@@ -11,35 +11,40 @@ It prints the composed prompt and the chosen decoding parameters so you can wire
 these into your actual LLM client elsewhere in the project.
 """
 from __future__ import annotations
-import argparse
+import os
 import sys
-from pathlib import Path
-import importlib.util
+from types import SimpleNamespace
 
 # Load minimal prompt builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+
+# Defaults for both the argparse and the no-flags paths of parse_args
+_DEFAULT_MESSAGE = "Explain beam search vs. sampling."
+_DEFAULT_PARAMS = {"temperature": 0.7, "top_k": None, "top_p": None}
 
 
 def parse_args(argv: list[str]):
-    p = argparse.ArgumentParser(description="Temperature/decoding params demo")
-    p.add_argument("message", nargs="*", help="User request")
-    p.add_argument("--temperature", "-t", type=float, default=0.7, help="Sampling temperature (0.0-2.0)")
-    p.add_argument("--top-k", type=int, default=None, help="Top-K sampling cutoff (e.g., 40)")
-    p.add_argument("--top-p", type=float, default=None, help="Nucleus sampling probability (e.g., 0.9)")
-    args = p.parse_args(argv)
-    msg = " ".join(args.message) or "Explain beam search vs. sampling."
+    if not any(a.startswith("-") for a in argv):
+        # No flags: the defaults apply and argparse is never imported
+        args = SimpleNamespace(message=argv, **_DEFAULT_PARAMS)
+    else:
+        import argparse
+        p = argparse.ArgumentParser(description="Temperature/decoding params demo")
+        p.add_argument("message", nargs="*", help="User request")
+        p.add_argument("--temperature", "-t", type=float, help="Sampling temperature (0.0-2.0)")
+        p.add_argument("--top-k", type=int, help="Top-K sampling cutoff (e.g., 40)")
+        p.add_argument("--top-p", type=float, help="Nucleus sampling probability (e.g., 0.9)")
+        p.set_defaults(**_DEFAULT_PARAMS)
+        args = p.parse_args(argv)
+    msg = " ".join(args.message) or _DEFAULT_MESSAGE
     return msg, args
 
 
 if __name__ == "__main__":
     user_msg, args = parse_args(sys.argv[1:])
-    parts = rb.build_prompt(user_msg)
+    parts = build_prompt(user_msg)
 
     print("===== TEMPERATURE / DECODING DEMO =====\n")
     print("----- SYSTEM -----\n")
@@ -3,58 +3,70 @@ Token count logging demo.
 
 This script composes system + user prompts and logs token counts for each part
 (and total). It prefers `tiktoken` when available; otherwise uses a heuristic.
+With `--no-tokens` it reports character counts and never loads the tokenizer.
 
 Run:
   python scripts/demo/token_count_demo.py "Explain quicksort and its complexity" --model gpt-3.5-turbo
+  python scripts/demo/token_count_demo.py "Explain quicksort and its complexity" --no-tokens
 """
 from __future__ import annotations
+import os
 import sys
-import argparse
-from pathlib import Path
-import importlib.util
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional
 
 # Load runtime builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
 
-# Load tokenizer util
-TOKENIZER_PATH = Path(__file__).parents[2] / "backend" / "python_service" / "utils" / "tokenizer.py"
-if not TOKENIZER_PATH.exists():
-    raise SystemExit("tokenizer.py not found. Please ensure utils/tokenizer.py exists.")
+@lru_cache(maxsize=1024)
+def _count(text: str, model: Optional[str]) -> int:
+    # The system prompt is identical across calls; only tokenize it once per model.
+    # The tokenizer util (and tiktoken behind it) is imported on first use only.
+    from utils import tokenizer
+    return tokenizer.count_tokens(text, model_name=model)
 
-spec_tok = importlib.util.spec_from_file_location("tokenizer", str(TOKENIZER_PATH))
-tokenizer = importlib.util.module_from_spec(spec_tok)  # type: ignore
-spec_tok.loader.exec_module(tokenizer)  # type: ignore
+
+_DEFAULT_MESSAGE = "Explain quicksort and its complexity"
+_DEFAULT_OPTIONS = {"model": None, "no_tokens": False}
 
 
 def parse_args(argv):
-    p = argparse.ArgumentParser(description="Token count logging demo")
-    p.add_argument("message", nargs="*", help="User request")
-    p.add_argument("--model", "-m", default=None, help="Model name hint for tokenizer (e.g., gpt-3.5-turbo)")
-    args = p.parse_args(argv)
-    msg = " ".join(args.message) or "Explain quicksort and its complexity"
-    return msg, args.model
+    if not any(a.startswith("-") for a in argv):
+        # No flags: every word is part of the message, so skip building (and importing) argparse
+        args = SimpleNamespace(message=argv, **_DEFAULT_OPTIONS)
+    else:
+        import argparse
+        p = argparse.ArgumentParser(description="Token count logging demo")
+        p.add_argument("message", nargs="*", help="User request")
+        p.add_argument("--model", "-m", help="Model name hint for tokenizer (e.g., gpt-3.5-turbo)")
+        p.add_argument("--no-tokens", action="store_true", help="Report character counts; skip loading the tokenizer")
+        p.set_defaults(**_DEFAULT_OPTIONS)
+        args = p.parse_args(argv)
+    msg = " ".join(args.message) or _DEFAULT_MESSAGE
+    return msg, args.model, args.no_tokens
 
 
 if __name__ == "__main__":
-    user_msg, model_name = parse_args(sys.argv[1:])
-    parts = rb.build_prompt(user_msg)
+    user_msg, model_name, no_tokens = parse_args(sys.argv[1:])
+    parts = build_prompt(user_msg)
 
-    sys_tokens = tokenizer.count_tokens(parts.system, model_name=model_name)
-    usr_tokens = tokenizer.count_tokens(parts.user, model_name=model_name)
-    total = sys_tokens + usr_tokens
+    if no_tokens:
+        unit = "chars"
+        sys_count, usr_count = len(parts.system), len(parts.user)
+    else:
+        unit = "tokens"
+        sys_count, usr_count = _count(parts.system, model_name), _count(parts.user, model_name)
+    total = sys_count + usr_count
 
     print("===== TOKEN COUNT DEMO =====\n")
-    print("----- SYSTEM (tokens) -----\n")
-    print(sys_tokens)
-    print("\n----- USER (tokens) -----\n")
-    print(usr_tokens)
-    print("\n----- TOTAL (tokens) -----\n")
+    print(f"----- SYSTEM ({unit}) -----\n")
+    print(sys_count)
+    print(f"\n----- USER ({unit}) -----\n")
+    print(usr_count)
+    print(f"\n----- TOTAL ({unit}) -----\n")
     print(total)
 
     print("\nNote: Use these counts to budget context or log usage after each AI call.")
\ No newline at end of file
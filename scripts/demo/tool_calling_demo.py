@@ -15,21 +15,20 @@ Run examples:
   python scripts/demo/tool_calling_demo.py --json '{"tool":"get_weather","arguments":{"location":"Paris","unit":"C","date":"2025-08-21"}}'
 """
 from __future__ import annotations
-import argparse
 import json
+import os
 import sys
-from pathlib import Path
-import importlib.util
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
 
 # Load runtime builder
-RUNTIME_BUILDER = Path(__file__).parents[2] / "backend" / "python_service" / "prompts" / "runtime_builder.py"
-if not RUNTIME_BUILDER.exists():
-    raise SystemExit("runtime_builder.py not found. Ensure repo structure is intact.")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import build_prompt  # noqa: E402
 
-spec = importlib.util.spec_from_file_location("runtime_builder", str(RUNTIME_BUILDER))
-rb = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(rb)  # type: ignore
+# Schema validation: compiled with fastjsonschema or jsonschema if installed,
+# otherwise minimal structural checks are used
+from _jsonutil import compile_validator  # noqa: E402
 
 # Define a small toolset with parameter schemas
 TOOLS: Dict[str, Dict[str, Any]] = {
@@ -82,38 +81,61 @@ TOOLS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def build_instruction(user_goal: str) -> str:
-    tool_specs = [
+@lru_cache(maxsize=None)
+def tool_validator(tool: str) -> Optional[Callable[[Any], Any]]:
+    # One compiled validator per tool's parameter schema, built on first use
+    return compile_validator(TOOLS[tool]["parameters"])
+
+
+# TOOLS is constant, so serialize the spec list once
+TOOL_SPECS_JSON = json.dumps(
+    [
         {
             "name": name,
             "description": spec["description"],
             "parameters": spec["parameters"],
         }
         for name, spec in TOOLS.items()
-    ]
-
-    lines = [
-        "You are a tool-using assistant. Select exactly one tool that best solves the user's request.",
-        "Return ONLY a JSON object, no prose, of the form:",
-        '{\n  "tool": "<tool_name>",\n  "arguments": { /* per tool schema */ }\n}',
-        "Do not include explanations.",
-        f"User goal: {user_goal or 'General task'}",
-        "Available tools (name, description, parameters JSON Schema):",
-        "```json",
-        json.dumps(tool_specs, indent=2),
-        "```",
-        "Rules:",
-        "- Choose the most appropriate single tool.",
-        "- Arguments must validate against the chosen tool's JSON Schema.",
-        "- Provide only the fields defined by the schema (no extras).",
-    ]
-    return "\n".join(lines)
+    ],
+    indent=2,
+)
+
+# Everything around the user goal is constant; join it once at import
+_PREFIX = "\n".join([
+    "You are a tool-using assistant. Select exactly one tool that best solves the user's request.",
+    "Return ONLY a JSON object, no prose, of the form:",
+    '{\n  "tool": "<tool_name>",\n  "arguments": { /* per tool schema */ }\n}',
+    "Do not include explanations.",
+])
+_SUFFIX = "\n".join([
+    "Available tools (name, description, parameters JSON Schema):",
+    "```json",
+    TOOL_SPECS_JSON,
+    "```",
+    "Rules:",
+    "- Choose the most appropriate single tool.",
+    "- Arguments must validate against the chosen tool's JSON Schema.",
+    "- Provide only the fields defined by the schema (no extras).",
+])
+
+
+def build_instruction(user_goal: str) -> str:
+    return f"{_PREFIX}\nUser goal: {user_goal or 'General task'}\n{_SUFFIX}"
+
+
+# No tool call to validate unless --json is given (argparse and fast path alike)
+_DEFAULT_OPTIONS = {"json_str": None}
 
 
 def parse_args(argv: List[str]):
+    if not any(a.startswith("-") for a in argv):
+        # Prompt-only run (nothing to validate): skip argparse entirely
+        return SimpleNamespace(message=argv, **_DEFAULT_OPTIONS)
+    import argparse
     p = argparse.ArgumentParser(description="Function/Tool calling demo")
     p.add_argument("message", nargs="*", help="User goal/request")
     p.add_argument("--json", dest="json_str", help="Candidate tool-call JSON to validate")
+    p.set_defaults(**_DEFAULT_OPTIONS)
     return p.parse_args(argv)
 
 
@@ -133,20 +155,20 @@ def validate_tool_call(payload: Any) -> tuple[bool, str]:
     if not isinstance(args, dict):
         return False, "'arguments' must be an object"
 
-    schema = TOOLS[tool]["parameters"]
-    # Prefer jsonschema if installed
-    try:
-        import jsonschema  # type: ignore
-        jsonschema.validate(instance=args, schema=schema)  # type: ignore
-        return True, "Valid per JSON Schema"
-    except Exception as e:
-        # Minimal fallback: check required keys exist
-        req = set(schema.get("required", []))
-        if not req.issubset(args.keys()):
-            missing = req - set(args.keys())
-            return False, f"Missing required argument(s): {sorted(missing)}"
-        # Soft pass (install jsonschema for strict validation)
-        return True, "Valid by minimal checks (install jsonschema for strict validation)"
+    validate = tool_validator(tool)
+    if validate is not None:
+        try:
+            validate(args)
+            return True, "Valid per JSON Schema"
+        except Exception as e:
+            return False, f"Schema validation failed: {e}"
+    # Minimal fallback: check required keys exist
+    req = set(TOOLS[tool]["parameters"].get("required", []))
+    if not req.issubset(args.keys()):
+        missing = req - set(args.keys())
+        return False, f"Missing required argument(s): {sorted(missing)}"
+    # Soft pass (install fastjsonschema or jsonschema for strict validation)
+    return True, "Valid by minimal checks (install fastjsonschema or jsonschema for strict validation)"
 
 
 if __name__ == "__main__":
@@ -154,7 +176,7 @@ if __name__ == "__main__":
     user_goal = " ".join(args.message) or "General task"
 
     instruction = build_instruction(user_goal)
-    parts = rb.build_prompt(instruction)
+    parts = build_prompt(instruction)
 
     print("===== TOOL CALLING DEMO =====\n")
     print("----- SYSTEM -----\n")